@@ -539,9 +539,7 @@ def backup_db_to_csv():
 
 def calculate_tax_from_db(income: float, country: str, tax_type: str) -> float:
     """Generic tax calculator that fetches brackets from DB."""
-    brackets = get_tax_brackets(country, tax_type)
-    if not brackets:
-        raise ValueError(f"No tax brackets found for {country} {tax_type}")
+    brackets = require_tax_brackets(country, tax_type)
 
     tax = 0
     prev = 0
@@ -583,6 +581,14 @@ def get_tax_brackets(country: str, tax_type: str, include_id: bool = False):
     return rows
 
 
+def require_tax_brackets(country: str, tax_type: str):
+    """get_tax_brackets, raising ValueError when the country/type has none."""
+    brackets = get_tax_brackets(country, tax_type)
+    if not brackets:
+        raise ValueError(f"No tax brackets found for {country} {tax_type}")
+    return brackets
+
+
 def add_tax_bracket(country: str, tax_type: str, income_limit: float, rate: float):
     """Add a single tax bracket to the database."""
     conn = get_conn()
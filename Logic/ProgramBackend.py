@@ -105,9 +105,7 @@ def calculate_tax_from_db(income: float, country: str, tax_type: str) -> float:
     """
     Generic tax calculator that fetches brackets from DB.
     """
-    brackets = setup.get_tax_brackets(country, tax_type)
-    if not brackets:
-        raise ValueError(f"No tax brackets found for {country} {tax_type}")
+    brackets = setup.require_tax_brackets(country, tax_type)
 
     tax = 0
     prev = 0
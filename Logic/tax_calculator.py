@@ -55,9 +55,7 @@ def calculate_tax_from_db(income: float, country: str, tax_type: str) -> float:
         - Brackets are fetched from the tax_brackets database table
         - Applies standard deductions (if configured in tax_engine)
     """
-    brackets = setup.get_tax_brackets(country, tax_type)
-    if not brackets:
-        raise ValueError(f"No tax brackets found for {country} {tax_type}")
+    brackets = setup.require_tax_brackets(country, tax_type)
 
     return calculate_tax(income, brackets)
 
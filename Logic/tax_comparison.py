@@ -16,6 +16,11 @@ DIVIDEND_TAX_RATES: Dict[str, float] = {
 }
 
 
+def _effective_rate(tax: float, income: float) -> float:
+    """Return tax as a percentage of income, or 0 when there is no income."""
+    return (tax / income * 100) if income > 0 else 0
+
+
 def calculate_all_tax_scenarios(
     revenue: float, costs: float, num_people: int, country: str
 ) -> Dict[str, Any]:
@@ -71,9 +76,7 @@ def calculate_all_tax_scenarios(
         "tax_paid": individual_tax,
         "take_home_per_person": individual_take_home,
         "take_home_total": individual_total,
-        "effective_rate": (individual_tax / individual_income * 100)
-        if individual_income > 0
-        else 0,
+        "effective_rate": _effective_rate(individual_tax, individual_income),
         "tax_breakdown": [{"label": "Personal Income Tax", "amount": individual_tax}],
     }
 
@@ -98,9 +101,7 @@ def calculate_all_tax_scenarios(
         "total_tax": corporate_tax + salary_personal_tax,
         "take_home_per_person": salary_per_person,
         "take_home_total": salary_take_home,
-        "effective_rate": ((corporate_tax + salary_personal_tax) / income * 100)
-        if income > 0
-        else 0,
+        "effective_rate": _effective_rate(corporate_tax + salary_personal_tax, income),
         "tax_breakdown": [
             {"label": "Corporate Tax", "amount": corporate_tax},
             {"label": "Personal Income Tax (on salary)", "amount": salary_personal_tax},
@@ -123,9 +124,7 @@ def calculate_all_tax_scenarios(
         "total_tax": corporate_tax + dividend_tax,
         "take_home_per_person": dividend_per_person,
         "take_home_total": dividend_take_home,
-        "effective_rate": ((corporate_tax + dividend_tax) / income * 100)
-        if income > 0
-        else 0,
+        "effective_rate": _effective_rate(corporate_tax + dividend_tax, income),
         "tax_breakdown": [
             {"label": "Corporate Tax", "amount": corporate_tax},
             {"label": f"Dividend Tax ({dividend_rate*100}%)", "amount": dividend_tax},
@@ -144,7 +143,7 @@ def calculate_all_tax_scenarios(
         "take_home_per_person": 0,
         "take_home_total": 0,
         "company_retained": after_corp_tax,
-        "effective_rate": (corporate_tax / income * 100) if income > 0 else 0,
+        "effective_rate": _effective_rate(corporate_tax, income),
         "tax_breakdown": [
             {"label": "Corporate Tax", "amount": corporate_tax},
             {
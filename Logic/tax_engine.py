@@ -4,7 +4,10 @@ Handles all tax scenarios: Individual, Business with Salary/Dividend/Mixed/Reinv
 """
 import sys
 import os
-from typing import Dict, List, Tuple, Any, Optional
+from bisect import bisect_left
+from typing import Callable, Dict, List, Tuple, Any, Optional
+
+import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from DB import setup
@@ -104,6 +107,37 @@ CANADA_ONTARIO_BRACKETS = [
 ]
 
 
+def _bracket_table(brackets: Tuple[Tuple[float, float], ...]) -> tuple:
+    """
+    Precompute the lookup table for a fixed bracket schedule.
+
+    Returns (limits, rates, floors, cumulative, capped) where floors[i] is the
+    lower edge of bracket i, cumulative[i] is the tax owed on all brackets below
+    it and capped is the tax owed once income exceeds the last limit.
+    """
+    limits, rates, floors, cumulative = [], [], [], []
+    tax = 0
+    prev = 0
+    for limit, rate in brackets:
+        limits.append(limit)
+        rates.append(rate)
+        floors.append(prev)
+        cumulative.append(tax)
+        tax += (limit - prev) * rate
+        prev = limit
+    return tuple(limits), tuple(rates), tuple(floors), tuple(cumulative), tax
+
+
+def _tax_from_table(income: float, table: tuple) -> float:
+    """Evaluate bracket tax against a table built by _bracket_table."""
+    limits, rates, floors, cumulative, capped = table
+    i = bisect_left(limits, income)
+    if i == len(limits):
+        # Income above the last limit is not taxed further
+        return capped
+    return cumulative[i] + (income - floors[i]) * rates[i]
+
+
 def calculate_tax_from_brackets(
     income: float, brackets: list[tuple[float, float]]
 ) -> float:
@@ -111,7 +145,9 @@ def calculate_tax_from_brackets(
     Calculate tax from progressive tax brackets using standard algorithm.
 
     This is a DRY (Don't Repeat Yourself) helper function to eliminate duplicate
-    bracket calculation code throughout the module.
+    bracket calculation code throughout the module. Schedules that are reused
+    (the built-in ones and memoized DB brackets) go through _bracket_table and
+    _tax_from_table instead.
 
     Args:
         income: The income amount to calculate tax on
@@ -137,6 +173,39 @@ def calculate_tax_from_brackets(
     return tax
 
 
+# Bracket tables for the built-in schedules, built once at import
+_UK_TABLE = _bracket_table(tuple(UK_TAX_BRACKETS))
+_CANADA_FEDERAL_TABLE = _bracket_table(tuple(CANADA_FEDERAL_BRACKETS))
+_CANADA_ONTARIO_TABLE = _bracket_table(tuple(CANADA_ONTARIO_BRACKETS))
+_STATE_TABLES = {
+    state: _bracket_table(tuple(data["brackets"]))
+    for state, data in STATE_TAX_RATES.items()
+}
+
+
+def _table_arrays(table: tuple) -> tuple:
+    """
+    Convert a _bracket_table result to float64 arrays for vectorized lookups.
+
+    rates, floors and cumulative get one extra slot so that an index one past
+    the last limit evaluates to the capped tax.
+    """
+    limits, rates, floors, cumulative, capped = table
+    return (
+        np.asarray(limits, dtype=np.float64),
+        np.asarray(rates + (0,), dtype=np.float64),
+        np.asarray(floors + (0,), dtype=np.float64),
+        np.asarray(cumulative + (capped,), dtype=np.float64),
+    )
+
+
+_STATE_ARRAYS = {state: _table_arrays(table) for state, table in _STATE_TABLES.items()}
+_US_STATE_DEDUCTIONS = {
+    state: STANDARD_DEDUCTIONS["US"] + data.get("standard_deduction", 0)
+    for state, data in STATE_TAX_RATES.items()
+}
+
+
 def calculate_self_employment_tax(income: float, country: str) -> dict:
     """
     Calculate self-employment tax (US only - Social Security + Medicare).
@@ -190,30 +259,46 @@ def apply_standard_deduction(
     """
     deduction = STANDARD_DEDUCTIONS.get(country, 0)
 
-    # Add state deduction for US states
-    if country == "US" and state and state in STATE_TAX_RATES:
-        deduction += STATE_TAX_RATES[state].get("standard_deduction", 0)
+    # US federal + state deduction, precomputed per state
+    if country == "US" and state:
+        deduction = _US_STATE_DEDUCTIONS.get(state, deduction)
 
-    return max(0, income - deduction)
+    taxable = income - deduction
+    return taxable if taxable > 0 else 0
 
 
 def calculate_state_tax(income: float, state: str) -> float:
     """
     Calculate state income tax for US states.
     """
-    if state not in STATE_TAX_RATES:
+    table = _STATE_TABLES.get(state)
+    if table is None:
         return 0
+    return _tax_from_table(income, table)
+
+
+def calculate_state_tax_vec(incomes: np.ndarray, state: str) -> np.ndarray:
+    """
+    Calculate state income tax for many incomes at once.
+
+    Vectorized counterpart of calculate_state_tax: returns a float64 array
+    with the same values calculate_state_tax gives for each income.
+    """
+    incomes = np.asarray(incomes, dtype=np.float64)
+    arrays = _STATE_ARRAYS.get(state)
+    if arrays is None:
+        return np.zeros_like(incomes)
 
-    state_data = STATE_TAX_RATES[state]
-    brackets = state_data["brackets"]
-    return calculate_tax_from_brackets(income, brackets)
+    limits, rates, floors, cumulative = arrays
+    i = np.searchsorted(limits, incomes, side="left")
+    return cumulative[i] + (incomes - floors[i]) * rates[i]
 
 
 def calculate_uk_tax(income: float) -> float:
     """
     Calculate UK income tax using UK brackets.
     """
-    return calculate_tax_from_brackets(income, UK_TAX_BRACKETS)
+    return _tax_from_table(income, _UK_TABLE)
 
 
 def calculate_canada_tax(income: float) -> dict:
@@ -222,10 +307,10 @@ def calculate_canada_tax(income: float) -> dict:
     Using Ontario as default province.
     """
     # Federal tax
-    federal_tax = calculate_tax_from_brackets(income, CANADA_FEDERAL_BRACKETS)
+    federal_tax = _tax_from_table(income, _CANADA_FEDERAL_TABLE)
 
     # Provincial tax (Ontario)
-    provincial_tax = calculate_tax_from_brackets(income, CANADA_ONTARIO_BRACKETS)
+    provincial_tax = _tax_from_table(income, _CANADA_ONTARIO_TABLE)
 
     return {
         "federal_tax": federal_tax,
@@ -266,7 +351,8 @@ def calculate_optimal_salary(after_corp_tax: float, country: str) -> dict:
         bracket_12_top = 44725
         optimal_salary = min(after_corp_tax, bracket_12_top + standard_deduction)
 
-        dividend_amount = max(0, after_corp_tax - optimal_salary)
+        remainder = after_corp_tax - optimal_salary
+        dividend_amount = remainder if remainder > 0 else 0
 
         return {
             "recommended_salary": optimal_salary,
@@ -281,7 +367,8 @@ def calculate_optimal_salary(after_corp_tax: float, country: str) -> dict:
         bracket_24_top = 20200
         optimal_salary = min(after_corp_tax, bracket_24_top + standard_deduction)
 
-        dividend_amount = max(0, after_corp_tax - optimal_salary)
+        remainder = after_corp_tax - optimal_salary
+        dividend_amount = remainder if remainder > 0 else 0
 
         return {
             "recommended_salary": optimal_salary,
@@ -321,342 +408,539 @@ def calculate_project_taxes(
             - net_income_group: Total take-home for the group
             - net_income_per_person: Average take-home per person
             - effective_rate: Total tax / gross income
-            - breakdown: List of tax components
+            - breakdown: List of tax components, each a dict with a stable
+              "kind" key (e.g. "income_tax", "corporate_tax") plus a display
+              "label", the "amount" and an optional "note"
     """
+    return _calculate_project_taxes(
+        revenue,
+        costs,
+        num_people,
+        country,
+        tax_structure,
+        distribution_method,
+        salary_amount,
+        state,
+        _tax_from_db,
+    )
 
-    gross_income = revenue - costs
 
-    if num_people == 0:
-        raise ValueError("Number of people must be greater than 0")
+def _tax_from_db(income: float, country: str, tax_type: str) -> float:
+    """setup.calculate_tax_from_db evaluated with calculate_tax_from_brackets."""
+    return calculate_tax_from_brackets(
+        income, setup.require_tax_brackets(country, tax_type)
+    )
 
-    # ===== INDIVIDUAL TAX (Self-Employed / Freelancer) =====
-    if tax_structure == "Individual":
-        individual_income = gross_income / num_people
-
-        # Country-specific calculations
-        if country == "UK":
-            # UK Individual Tax
-            personal_tax_per_person = calculate_uk_tax(individual_income)
-            se_tax_per_person = (
-                0  # UK uses National Insurance instead (simplified here)
-            )
-            state_tax_per_person = 0
-
-            breakdown = [
-                {
-                    "label": "UK Income Tax",
-                    "amount": personal_tax_per_person * num_people,
-                }
-            ]
-
-        elif country == "Canada":
-            # Canada Individual Tax
-            canada_taxes = calculate_canada_tax(individual_income)
-            personal_tax_per_person = canada_taxes["federal_tax"]
-            state_tax_per_person = canada_taxes["provincial_tax"]  # Provincial tax
-            se_tax_per_person = 0  # Canada has different system (simplified)
-
-            breakdown = [
-                {
-                    "label": "Federal Tax (Canada)",
-                    "amount": personal_tax_per_person * num_people,
-                },
-                {
-                    "label": "Provincial Tax (Ontario)",
-                    "amount": state_tax_per_person * num_people,
-                },
-            ]
 
-        else:
-            # US, Spain, and other countries
-            # Apply standard deduction
-            taxable_income = apply_standard_deduction(individual_income, country)
-
-            # Calculate federal/national income tax on taxable income
-            personal_tax_per_person = setup.calculate_tax_from_db(
-                taxable_income, country, "Individual"
-            )
-
-            # Calculate self-employment tax (US only, on gross income before deduction)
-            se_tax_result = calculate_self_employment_tax(individual_income, country)
-            se_tax_per_person = se_tax_result["total_se_tax"]
-
-            # Calculate state tax (US only, if state provided)
-            state_tax_per_person = 0
-            if country == "US" and state:
-                state_tax_per_person = calculate_state_tax(individual_income, state)
-
-            breakdown = [
-                {
-                    "label": "Federal Income Tax",
-                    "amount": personal_tax_per_person * num_people,
-                }
-            ]
-
-            # Add SE tax breakdown if applicable
-            if se_tax_per_person > 0:
-                breakdown.append(
-                    {
-                        "label": "Self-Employment Tax (SS + Medicare)",
-                        "amount": se_tax_per_person * num_people,
-                        "note": f"Social Security: ${se_tax_result['social_security_tax'] * num_people:,.2f}, Medicare: ${se_tax_result['medicare_tax'] * num_people:,.2f}",
-                    }
-                )
-
-            # Add state tax if applicable
-            if state_tax_per_person > 0:
-                breakdown.append(
-                    {
-                        "label": f"State Tax ({state})",
-                        "amount": state_tax_per_person * num_people,
-                    }
-                )
-
-        # Total tax per person = income tax + SE tax + state tax
-        total_tax_per_person = (
-            personal_tax_per_person + se_tax_per_person + state_tax_per_person
+def _memoized_tax_from_db() -> Callable[[float, str, str], float]:
+    """
+    Return a _tax_from_db that reads each (country, tax_type) bracket set once
+    and evaluates it against a prebuilt _bracket_table.
+
+    Meant for one logical calculation spanning several project scenarios, so
+    bracket edits made between calls are still picked up next time.
+    """
+    schedules: Dict[Tuple[str, str], tuple] = {}
+
+    def tax_from_db(income: float, country: str, tax_type: str) -> float:
+        key = (country, tax_type)
+        if key not in schedules:
+            brackets = setup.require_tax_brackets(country, tax_type)
+            # Inner pairs may be lists (DB rows); the table wants plain tuples
+            schedules[key] = _bracket_table(tuple(map(tuple, brackets)))
+        return _tax_from_table(income, schedules[key])
+
+    return tax_from_db
+
+
+def calculate_project_taxes_batch(
+    revenues: List[float],
+    costs: List[float],
+    num_people: int,
+    country: str,
+    tax_structure: str,
+    distribution_method: str = "N/A",
+    salary_amount: float = 0,
+    state: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Calculate taxes for several revenue/cost scenarios that share one setup.
+
+    Equivalent to calling calculate_project_taxes once per (revenue, cost)
+    pair, but the country's tax brackets are read from the database once for
+    the whole batch instead of once per tax component per scenario.
+
+    Returns:
+        List of result dicts in the same order and shape as
+        calculate_project_taxes.
+
+    Raises:
+        ValueError: If revenues and costs have different lengths.
+    """
+    if len(revenues) != len(costs):
+        raise ValueError(
+            f"revenues and costs must have the same length, "
+            f"got {len(revenues)} and {len(costs)}"
         )
-        total_personal_tax = total_tax_per_person * num_people
 
-        net_income_per_person = individual_income - total_tax_per_person
-        net_income_group = net_income_per_person * num_people
+    tax_from_db = _memoized_tax_from_db()
+    return [
+        _calculate_project_taxes(
+            revenue,
+            cost,
+            num_people,
+            country,
+            tax_structure,
+            distribution_method,
+            salary_amount,
+            state,
+            tax_from_db,
+        )
+        for revenue, cost in zip(revenues, costs)
+    ]
 
-        return {
-            "gross_income": gross_income,
-            "corporate_tax": 0,
-            "personal_tax": personal_tax_per_person * num_people,
-            "se_tax": se_tax_per_person * num_people,
-            "state_tax": state_tax_per_person * num_people,
-            "dividend_tax": 0,
-            "total_tax": total_personal_tax,
-            "net_income_group": net_income_group,
-            "net_income_per_person": net_income_per_person,
-            "effective_rate": (total_personal_tax / gross_income * 100)
-            if gross_income > 0
-            else 0,
-            "standard_deduction_used": STANDARD_DEDUCTIONS.get(country, 0) * num_people
-            if country not in ["UK", "Canada"]
-            else 0,
-            "breakdown": breakdown,
+
+# Countries taxed outside the DB brackets, keyed for a single dict lookup
+_FLAT_CORPORATE_TAX_RATES: Dict[str, float] = {
+    "UK": UK_CORPORATE_TAX_RATE,
+    "Canada": CANADA_CORPORATE_TAX_RATE,
+}
+
+_SALARY_TAX_FUNCS: Dict[str, Callable[[float], float]] = {
+    "UK": calculate_uk_tax,
+    "Canada": lambda salary: calculate_canada_tax(salary)["total_tax"],
+}
+
+
+def _salary_tax(
+    salary: float, country: str, tax_from_db: Callable[[float, str, str], float]
+) -> float:
+    """Personal income tax on a salary paid out of the company."""
+    salary_tax_func = _SALARY_TAX_FUNCS.get(country)
+    if salary_tax_func is not None:
+        return salary_tax_func(salary)
+    # Apply standard deduction to salary
+    taxable_salary = apply_standard_deduction(salary, country)
+    return tax_from_db(taxable_salary, country, "Individual")
+
+
+def _uk_individual_taxes(
+    individual_income: float,
+    num_people: int,
+    country: str,
+    state: Optional[str],
+    tax_from_db: Callable[[float, str, str], float],
+) -> tuple:
+    """UK income tax per person; UK uses National Insurance instead of SE tax."""
+    personal_tax_per_person = calculate_uk_tax(individual_income)
+    breakdown = [
+        {
+            "kind": "income_tax",
+            "label": "UK Income Tax",
+            "amount": personal_tax_per_person * num_people,
         }
+    ]
+    return personal_tax_per_person, 0, 0, breakdown
 
-    # ===== BUSINESS TAX (Corporation) =====
-    elif tax_structure == "Business":
-        # Step 1: Apply QBI deduction for US businesses (reduces taxable income)
-        qbi_deduction = apply_qbi_deduction(gross_income, country)
-        taxable_business_income = gross_income - qbi_deduction
-
-        # Step 2: Company pays corporate tax on profits (after QBI deduction)
-        # For UK and Canada, use flat corporate tax rates
-        if country == "UK":
-            corporate_tax = taxable_business_income * UK_CORPORATE_TAX_RATE
-        elif country == "Canada":
-            corporate_tax = taxable_business_income * CANADA_CORPORATE_TAX_RATE
-        else:
-            corporate_tax = setup.calculate_tax_from_db(
-                taxable_business_income, country, "Business"
-            )
-
-        after_corp_tax = gross_income - corporate_tax
-
-        # Step 3: Distribute to owners based on distribution_method
-        if distribution_method == "Salary":
-            # Pay all after-tax profit as salary → triggers personal income tax
-            if country == "UK":
-                personal_tax = calculate_uk_tax(after_corp_tax)
-            elif country == "Canada":
-                canada_taxes = calculate_canada_tax(after_corp_tax)
-                personal_tax = canada_taxes["total_tax"]
-            else:
-                # Apply standard deduction to salary
-                taxable_salary = apply_standard_deduction(after_corp_tax, country)
-                personal_tax = setup.calculate_tax_from_db(
-                    taxable_salary, country, "Individual"
-                )
-
-            dividend_tax = 0
-            net_income_group = after_corp_tax - personal_tax
-            total_tax = corporate_tax + personal_tax
-
-            breakdown = []
-            if qbi_deduction > 0:
-                breakdown.append(
-                    {
-                        "label": "QBI Deduction (20%)",
-                        "amount": -qbi_deduction,
-                        "note": f"Reduces taxable business income by ${qbi_deduction:,.0f}",
-                    }
-                )
-            breakdown.extend(
-                [
-                    {"label": "Corporate Tax", "amount": corporate_tax},
-                    {"label": "Personal Tax (on salary)", "amount": personal_tax},
-                ]
-            )
-
-        elif distribution_method == "Dividend":
-            # Pay all after-tax profit as dividends → triggers dividend tax
-            dividend_rate = DIVIDEND_TAX_RATES.get(country, 0.15)
-            dividend_tax = after_corp_tax * dividend_rate
-            personal_tax = 0
-            net_income_group = after_corp_tax - dividend_tax
-            total_tax = corporate_tax + dividend_tax
-
-            breakdown = []
-            if qbi_deduction > 0:
-                breakdown.append(
-                    {
-                        "label": "QBI Deduction (20%)",
-                        "amount": -qbi_deduction,
-                        "note": f"Reduces taxable business income by ${qbi_deduction:,.0f}",
-                    }
-                )
-            breakdown.extend(
-                [
-                    {"label": "Corporate Tax", "amount": corporate_tax},
-                    {
-                        "label": f"Dividend Tax ({dividend_rate*100}%)",
-                        "amount": dividend_tax,
-                    },
-                ]
-            )
-
-        elif distribution_method == "Mixed":
-            # Pay some as salary, rest as dividend
-            # If salary_amount is 0, auto-calculate optimal split
-            if salary_amount == 0:
-                optimal = calculate_optimal_salary(after_corp_tax, country)
-                salary_amount = optimal["recommended_salary"]
-                auto_optimized = True
-            else:
-                auto_optimized = False
-
-            if salary_amount > after_corp_tax:
-                raise ValueError(
-                    f"Salary amount ({salary_amount}) exceeds after-tax profit ({after_corp_tax})"
-                )
-
-            # Salary portion
-            if country == "UK":
-                salary_tax = calculate_uk_tax(salary_amount)
-            elif country == "Canada":
-                canada_taxes = calculate_canada_tax(salary_amount)
-                salary_tax = canada_taxes["total_tax"]
-            else:
-                # Apply standard deduction to salary
-                taxable_salary = apply_standard_deduction(salary_amount, country)
-                salary_tax = setup.calculate_tax_from_db(
-                    taxable_salary, country, "Individual"
-                )
-
-            after_salary = after_corp_tax - salary_amount
-
-            # Dividend portion
-            dividend_rate = DIVIDEND_TAX_RATES.get(country, 0.15)
-            dividend_tax = after_salary * dividend_rate
-
-            net_income_group = salary_amount - salary_tax + after_salary - dividend_tax
-            personal_tax = salary_tax
-            total_tax = corporate_tax + salary_tax + dividend_tax
-
-            breakdown = []
-            if qbi_deduction > 0:
-                breakdown.append(
-                    {
-                        "label": "QBI Deduction (20%)",
-                        "amount": -qbi_deduction,
-                        "note": f"Reduces taxable business income by ${qbi_deduction:,.0f}",
-                    }
-                )
-            breakdown.extend(
-                [
-                    {"label": "Corporate Tax", "amount": corporate_tax},
-                    {
-                        "label": f"Personal Tax (on ${salary_amount:,.0f} salary)",
-                        "amount": salary_tax,
-                    },
-                    {
-                        "label": f"Dividend Tax ({dividend_rate*100}% on ${after_salary:,.0f})",
-                        "amount": dividend_tax,
-                    },
-                ]
-            )
-
-            if auto_optimized:
-                breakdown.append(
-                    {
-                        "label": "Auto-Optimized Split",
-                        "amount": 0,
-                        "note": calculate_optimal_salary(after_corp_tax, country)[
-                            "reason"
-                        ],
-                    }
-                )
-
-        elif distribution_method == "Reinvest":
-            # Keep money in company → no personal tax now
-            personal_tax = 0
-            dividend_tax = 0
-            net_income_group = 0  # No personal take-home
-            total_tax = corporate_tax
-
-            breakdown = []
-            if qbi_deduction > 0:
-                breakdown.append(
-                    {
-                        "label": "QBI Deduction (20%)",
-                        "amount": -qbi_deduction,
-                        "note": f"Reduces taxable business income by ${qbi_deduction:,.0f}",
-                    }
-                )
-            breakdown.extend(
-                [
-                    {"label": "Corporate Tax", "amount": corporate_tax},
-                    {
-                        "label": "Personal Tax",
-                        "amount": 0,
-                        "note": "Deferred until distribution",
-                    },
-                ]
-            )
 
-        else:
-            # Default to Salary if method not specified
-            personal_tax = setup.calculate_tax_from_db(
-                after_corp_tax, country, "Individual"
-            )
-            dividend_tax = 0
-            net_income_group = after_corp_tax - personal_tax
-            total_tax = corporate_tax + personal_tax
+def _canada_individual_taxes(
+    individual_income: float,
+    num_people: int,
+    country: str,
+    state: Optional[str],
+    tax_from_db: Callable[[float, str, str], float],
+) -> tuple:
+    """Canadian federal and provincial (Ontario) tax per person."""
+    canada_taxes = calculate_canada_tax(individual_income)
+    personal_tax_per_person = canada_taxes["federal_tax"]
+    state_tax_per_person = canada_taxes["provincial_tax"]  # Provincial tax
+    breakdown = [
+        {
+            "kind": "federal_tax",
+            "label": "Federal Tax (Canada)",
+            "amount": personal_tax_per_person * num_people,
+        },
+        {
+            "kind": "provincial_tax",
+            "label": "Provincial Tax (Ontario)",
+            "amount": state_tax_per_person * num_people,
+        },
+    ]
+    return personal_tax_per_person, 0, state_tax_per_person, breakdown
+
+
+def _bracket_individual_taxes(
+    individual_income: float,
+    num_people: int,
+    country: str,
+    state: Optional[str],
+    tax_from_db: Callable[[float, str, str], float],
+) -> tuple:
+    """Income, self-employment and state tax per person for US, Spain and others."""
+    # Apply standard deduction
+    taxable_income = apply_standard_deduction(individual_income, country)
+
+    # Calculate federal/national income tax on taxable income
+    personal_tax_per_person = tax_from_db(taxable_income, country, "Individual")
+
+    # Calculate self-employment tax (US only, on gross income before deduction)
+    se_tax_result = calculate_self_employment_tax(individual_income, country)
+    se_tax_per_person = se_tax_result["total_se_tax"]
+
+    # Calculate state tax (US only, if state provided)
+    state_tax_per_person = 0
+    if country == "US" and state:
+        state_tax_per_person = calculate_state_tax(individual_income, state)
+
+    breakdown = [
+        {
+            "kind": "income_tax",
+            "label": "Federal Income Tax",
+            "amount": personal_tax_per_person * num_people,
+        }
+    ]
+
+    # Add SE tax breakdown if applicable
+    if se_tax_per_person > 0:
+        breakdown.append(
+            {
+                "kind": "self_employment_tax",
+                "label": "Self-Employment Tax (SS + Medicare)",
+                "amount": se_tax_per_person * num_people,
+                "note": f"Social Security: ${se_tax_result['social_security_tax'] * num_people:,.2f}, Medicare: ${se_tax_result['medicare_tax'] * num_people:,.2f}",
+            }
+        )
 
-            breakdown = [
-                {"label": "Corporate Tax", "amount": corporate_tax},
-                {"label": "Personal Tax (on salary)", "amount": personal_tax},
-            ]
+    # Add state tax if applicable
+    if state_tax_per_person > 0:
+        breakdown.append(
+            {
+                "kind": "state_tax",
+                "label": f"State Tax ({state})",
+                "amount": state_tax_per_person * num_people,
+            }
+        )
 
-        net_income_per_person = net_income_group / num_people if num_people > 0 else 0
+    return personal_tax_per_person, se_tax_per_person, state_tax_per_person, breakdown
 
-        return {
-            "gross_income": gross_income,
-            "corporate_tax": corporate_tax,
-            "personal_tax": personal_tax,
-            "dividend_tax": dividend_tax,
-            "total_tax": total_tax,
-            "net_income_group": net_income_group,
-            "net_income_per_person": net_income_per_person,
-            "effective_rate": (total_tax / gross_income * 100)
-            if gross_income > 0
-            else 0,
-            "breakdown": breakdown,
-            "company_retained": after_corp_tax
-            if distribution_method == "Reinvest"
-            else 0,
+
+# Countries with their own individual tax rules; the rest use the DB brackets.
+# Each returns (personal, self-employment, state tax per person, breakdown)
+_INDIVIDUAL_TAX_FUNCS: Dict[str, Callable[..., tuple]] = {
+    "UK": _uk_individual_taxes,
+    "Canada": _canada_individual_taxes,
+}
+
+
+def _individual_project_taxes(
+    gross_income: float,
+    num_people: int,
+    country: str,
+    distribution_method: str,
+    salary_amount: float,
+    state: Optional[str],
+    tax_from_db: Callable[[float, str, str], float],
+) -> Dict[str, Any]:
+    """Individual (self-employed / freelancer) branch of _calculate_project_taxes."""
+    individual_income = gross_income / num_people
+
+    individual_taxes = _INDIVIDUAL_TAX_FUNCS.get(country, _bracket_individual_taxes)
+    (
+        personal_tax_per_person,
+        se_tax_per_person,
+        state_tax_per_person,
+        breakdown,
+    ) = individual_taxes(individual_income, num_people, country, state, tax_from_db)
+
+    # Total tax per person = income tax + SE tax + state tax
+    total_tax_per_person = (
+        personal_tax_per_person + se_tax_per_person + state_tax_per_person
+    )
+    total_personal_tax = total_tax_per_person * num_people
+
+    net_income_per_person = individual_income - total_tax_per_person
+    net_income_group = net_income_per_person * num_people
+
+    return {
+        "gross_income": gross_income,
+        "corporate_tax": 0,
+        "personal_tax": personal_tax_per_person * num_people,
+        "se_tax": se_tax_per_person * num_people,
+        "state_tax": state_tax_per_person * num_people,
+        "dividend_tax": 0,
+        "total_tax": total_personal_tax,
+        "net_income_group": net_income_group,
+        "net_income_per_person": net_income_per_person,
+        "effective_rate": (total_personal_tax / gross_income * 100)
+        if gross_income > 0
+        else 0,
+        "standard_deduction_used": STANDARD_DEDUCTIONS.get(country, 0) * num_people
+        if country not in _INDIVIDUAL_TAX_FUNCS
+        else 0,
+        "breakdown": breakdown,
+    }
+
+
+def _distribute_salary(
+    after_corp_tax: float,
+    country: str,
+    salary_amount: float,
+    tax_from_db: Callable[[float, str, str], float],
+) -> tuple:
+    """Pay all after-tax profit as salary → triggers personal income tax."""
+    personal_tax = _salary_tax(after_corp_tax, country, tax_from_db)
+    breakdown = [
+        {
+            "kind": "personal_tax",
+            "label": "Personal Tax (on salary)",
+            "amount": personal_tax,
+        }
+    ]
+    return personal_tax, 0, after_corp_tax - personal_tax, breakdown
+
+
+def _distribute_dividend(
+    after_corp_tax: float,
+    country: str,
+    salary_amount: float,
+    tax_from_db: Callable[[float, str, str], float],
+) -> tuple:
+    """Pay all after-tax profit as dividends → triggers dividend tax."""
+    dividend_rate = DIVIDEND_TAX_RATES.get(country, 0.15)
+    dividend_tax = after_corp_tax * dividend_rate
+    breakdown = [
+        {
+            "kind": "dividend_tax",
+            "label": f"Dividend Tax ({dividend_rate*100}%)",
+            "amount": dividend_tax,
+        }
+    ]
+    return 0, dividend_tax, after_corp_tax - dividend_tax, breakdown
+
+
+def _distribute_mixed(
+    after_corp_tax: float,
+    country: str,
+    salary_amount: float,
+    tax_from_db: Callable[[float, str, str], float],
+) -> tuple:
+    """Pay some as salary, rest as dividend."""
+    # If salary_amount is 0, auto-calculate optimal split
+    optimal = None
+    if salary_amount == 0:
+        optimal = calculate_optimal_salary(after_corp_tax, country)
+        salary_amount = optimal["recommended_salary"]
+
+    if salary_amount > after_corp_tax:
+        raise ValueError(
+            f"Salary amount ({salary_amount}) exceeds after-tax profit ({after_corp_tax})"
+        )
+
+    # Salary portion
+    salary_tax = _salary_tax(salary_amount, country, tax_from_db)
+
+    after_salary = after_corp_tax - salary_amount
+
+    # Dividend portion
+    dividend_rate = DIVIDEND_TAX_RATES.get(country, 0.15)
+    dividend_tax = after_salary * dividend_rate
+
+    net_income_group = salary_amount - salary_tax + after_salary - dividend_tax
+
+    breakdown = [
+        {
+            "kind": "personal_tax",
+            "label": f"Personal Tax (on ${salary_amount:,.0f} salary)",
+            "amount": salary_tax,
+        },
+        {
+            "kind": "dividend_tax",
+            "label": f"Dividend Tax ({dividend_rate*100}% on ${after_salary:,.0f})",
+            "amount": dividend_tax,
+        },
+    ]
+
+    if optimal is not None:
+        breakdown.append(
+            {
+                "kind": "auto_optimized",
+                "label": "Auto-Optimized Split",
+                "amount": 0,
+                "note": optimal["reason"],
+            }
+        )
+
+    return salary_tax, dividend_tax, net_income_group, breakdown
+
+
+def _distribute_reinvest(
+    after_corp_tax: float,
+    country: str,
+    salary_amount: float,
+    tax_from_db: Callable[[float, str, str], float],
+) -> tuple:
+    """Keep money in company → no personal tax now."""
+    breakdown = [
+        {
+            "kind": "personal_tax",
+            "label": "Personal Tax",
+            "amount": 0,
+            "note": "Deferred until distribution",
         }
+    ]
+    # No personal take-home
+    return 0, 0, 0, breakdown
+
+
+def _distribute_unspecified(
+    after_corp_tax: float,
+    country: str,
+    salary_amount: float,
+    tax_from_db: Callable[[float, str, str], float],
+) -> tuple:
+    """Default to Salary if method not specified."""
+    personal_tax = tax_from_db(after_corp_tax, country, "Individual")
+    breakdown = [
+        {
+            "kind": "personal_tax",
+            "label": "Personal Tax (on salary)",
+            "amount": personal_tax,
+        }
+    ]
+    return personal_tax, 0, after_corp_tax - personal_tax, breakdown
+
 
+# Business distribution methods; each returns (personal tax, dividend tax,
+# net income for the group, breakdown rows after the corporate tax)
+_DISTRIBUTION_FUNCS: Dict[str, Callable[..., tuple]] = {
+    "Salary": _distribute_salary,
+    "Dividend": _distribute_dividend,
+    "Mixed": _distribute_mixed,
+    "Reinvest": _distribute_reinvest,
+}
+
+
+def _business_project_taxes(
+    gross_income: float,
+    num_people: int,
+    country: str,
+    distribution_method: str,
+    salary_amount: float,
+    state: Optional[str],
+    tax_from_db: Callable[[float, str, str], float],
+) -> Dict[str, Any]:
+    """Business (corporation) branch of _calculate_project_taxes."""
+    # Step 1: Apply QBI deduction for US businesses (reduces taxable income)
+    qbi_deduction = apply_qbi_deduction(gross_income, country)
+    taxable_business_income = gross_income - qbi_deduction
+
+    # Step 2: Company pays corporate tax on profits (after QBI deduction)
+    # For UK and Canada, use flat corporate tax rates
+    flat_rate = _FLAT_CORPORATE_TAX_RATES.get(country)
+    if flat_rate is not None:
+        corporate_tax = taxable_business_income * flat_rate
     else:
+        corporate_tax = tax_from_db(taxable_business_income, country, "Business")
+
+    after_corp_tax = gross_income - corporate_tax
+
+    # Step 3: Distribute to owners based on distribution_method
+    distribute = _DISTRIBUTION_FUNCS.get(distribution_method, _distribute_unspecified)
+    personal_tax, dividend_tax, net_income_group, distribution_rows = distribute(
+        after_corp_tax, country, salary_amount, tax_from_db
+    )
+    total_tax = corporate_tax + personal_tax + dividend_tax
+
+    breakdown = []
+    # The unspecified-method fallback lists only corporate and personal tax
+    if qbi_deduction > 0 and distribution_method in _DISTRIBUTION_FUNCS:
+        breakdown.append(
+            {
+                "kind": "qbi_deduction",
+                "label": "QBI Deduction (20%)",
+                "amount": -qbi_deduction,
+                "note": f"Reduces taxable business income by ${qbi_deduction:,.0f}",
+            }
+        )
+    breakdown.append(
+        {
+            "kind": "corporate_tax",
+            "label": "Corporate Tax",
+            "amount": corporate_tax,
+        }
+    )
+    breakdown.extend(distribution_rows)
+
+    net_income_per_person = net_income_group / num_people if num_people > 0 else 0
+
+    return {
+        "gross_income": gross_income,
+        "corporate_tax": corporate_tax,
+        "personal_tax": personal_tax,
+        "dividend_tax": dividend_tax,
+        "total_tax": total_tax,
+        "net_income_group": net_income_group,
+        "net_income_per_person": net_income_per_person,
+        "effective_rate": (total_tax / gross_income * 100) if gross_income > 0 else 0,
+        "breakdown": breakdown,
+        "company_retained": after_corp_tax if distribution_method == "Reinvest" else 0,
+    }
+
+
+_TAX_STRUCTURE_FUNCS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "Individual": _individual_project_taxes,
+    "Business": _business_project_taxes,
+}
+
+
+def _calculate_project_taxes(
+    revenue: float,
+    costs: float,
+    num_people: int,
+    country: str,
+    tax_structure: str,
+    distribution_method: str,
+    salary_amount: float,
+    state: Optional[str],
+    tax_from_db: Callable[[float, str, str], float],
+) -> Dict[str, Any]:
+    """
+    Shared body of calculate_project_taxes and calculate_project_taxes_batch.
+
+    tax_from_db(income, country, tax_type) supplies the bracket tax for the
+    DB-backed schedules.
+    """
+
+    gross_income = revenue - costs
+
+    if num_people == 0:
+        raise ValueError("Number of people must be greater than 0")
+
+    project_taxes = _TAX_STRUCTURE_FUNCS.get(tax_structure)
+    if project_taxes is None:
         raise ValueError(
             f"Invalid tax_structure: {tax_structure}. Must be 'Individual' or 'Business'"
         )
+    return project_taxes(
+        gross_income,
+        num_people,
+        country,
+        distribution_method,
+        salary_amount,
+        state,
+        tax_from_db,
+    )
+
+
+# (strategy_name, tax_structure, distribution_method) compared by
+# get_optimal_strategy, in display order
+_STRATEGIES: Tuple[Tuple[str, str, str], ...] = (
+    ("Individual Tax", "Individual", "N/A"),
+    ("Business + Salary", "Business", "Salary"),
+    ("Business + Dividend", "Business", "Dividend"),
+    ("Business + Mixed (Optimized)", "Business", "Mixed"),
+    ("Business + Reinvest", "Business", "Reinvest"),
+)
 
 
 def get_optimal_strategy(
@@ -675,42 +959,23 @@ def get_optimal_strategy(
         - savings: Money saved vs worst strategy
     """
 
+    # All five strategies share the same bracket sets; read them once
+    tax_from_db = _memoized_tax_from_db()
     strategies = []
-
-    # Individual
-    individual = calculate_project_taxes(
-        revenue, costs, num_people, country, "Individual", "N/A", 0, state
-    )
-    individual["strategy_name"] = "Individual Tax"
-    strategies.append(individual)
-
-    # Business - Salary
-    business_salary = calculate_project_taxes(
-        revenue, costs, num_people, country, "Business", "Salary", 0, state
-    )
-    business_salary["strategy_name"] = "Business + Salary"
-    strategies.append(business_salary)
-
-    # Business - Dividend
-    business_dividend = calculate_project_taxes(
-        revenue, costs, num_people, country, "Business", "Dividend", 0, state
-    )
-    business_dividend["strategy_name"] = "Business + Dividend"
-    strategies.append(business_dividend)
-
-    # Business - Mixed (Auto-Optimized)
-    business_mixed = calculate_project_taxes(
-        revenue, costs, num_people, country, "Business", "Mixed", 0, state
-    )
-    business_mixed["strategy_name"] = "Business + Mixed (Optimized)"
-    strategies.append(business_mixed)
-
-    # Business - Reinvest
-    business_reinvest = calculate_project_taxes(
-        revenue, costs, num_people, country, "Business", "Reinvest", 0, state
-    )
-    business_reinvest["strategy_name"] = "Business + Reinvest"
-    strategies.append(business_reinvest)
+    for strategy_name, tax_structure, distribution_method in _STRATEGIES:
+        strategy = _calculate_project_taxes(
+            revenue,
+            costs,
+            num_people,
+            country,
+            tax_structure,
+            distribution_method,
+            0,
+            state,
+            tax_from_db,
+        )
+        strategy["strategy_name"] = strategy_name
+        strategies.append(strategy)
 
     # Find optimal (highest net income for strategies that give cash now)
     cashflow_strategies = [s for s in strategies if s["net_income_group"] > 0]
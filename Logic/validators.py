@@ -16,10 +16,15 @@ def validate_positive_number(value: float, field_name: str) -> float:
     return value
 
 
+# How far work shares may sum from 1.0, so hand-rounded splits like
+# 0.333/0.333/0.333 are accepted (matches api.models.ProjectCreate)
+WORK_SHARES_TOLERANCE = 0.01
+
+
 def validate_work_shares(shares: list[float]) -> None:
-    """Validate that work shares sum to 1.0 (with small tolerance)."""
+    """Validate that work shares sum to 1.0 (within WORK_SHARES_TOLERANCE)."""
     total = sum(shares)
-    if abs(total - 1.0) > 0.01:
+    if abs(total - 1.0) > WORK_SHARES_TOLERANCE:
         raise ValidationError(f"Work shares must sum to 1.0, got {total:.2f}")
 
 
@@ -8,7 +8,7 @@ import uuid
 from fastapi import Request
 from fastapi.responses import JSONResponse
 import logging
-from typing import Callable
+from typing import Callable, NamedTuple, Optional
 from exceptions import (
     MoneySplitException,
     ValidationError,
@@ -61,98 +61,96 @@ async def logging_middleware(request: Request, call_next: Callable) -> JSONRespo
     return response
 
 
+class _ErrorResponse(NamedTuple):
+    """How exception_handler reports one family of exceptions."""
+
+    status_code: int
+    error: str
+    log_level: int
+    log_prefix: str
+    # None returns the exception's own message; anything else is sent instead
+    # so the real error text stays out of the response
+    client_message: Optional[str] = None
+
+
+# Looked up through the exception's MRO so the most specific match wins
+_ERROR_RESPONSES = {
+    ValidationError: _ErrorResponse(
+        400, "Validation Error", logging.WARNING, "Validation error"
+    ),
+    NotFoundError: _ErrorResponse(
+        404, "Not Found", logging.WARNING, "Resource not found"
+    ),
+    DatabaseError: _ErrorResponse(
+        500,
+        "Database Error",
+        logging.ERROR,
+        "Database error",
+        client_message="An error occurred while accessing the database",
+    ),
+    TaxCalculationError: _ErrorResponse(
+        400, "Tax Calculation Error", logging.ERROR, "Tax calculation error"
+    ),
+    MoneySplitException: _ErrorResponse(
+        500, "Application Error", logging.ERROR, "Application error"
+    ),
+    Exception: _ErrorResponse(
+        500,
+        "Internal Server Error",
+        logging.CRITICAL,
+        "Unhandled exception",
+        client_message="An unexpected error occurred",
+    ),
+}
+
+
+def _error_response_for(exc: Exception) -> _ErrorResponse:
+    """Return the response details for the closest matching exception class."""
+    for cls in type(exc).__mro__:
+        details = _ERROR_RESPONSES.get(cls)
+        if details is not None:
+            return details
+    return _ERROR_RESPONSES[Exception]
+
+
+def _exception_message(exc: Exception) -> str:
+    """
+    Return the exception message, skipping str() for the single-string case.
+    Classes that override __str__ (e.g. KeyError quotes its key) still go
+    through str() so log output is unchanged.
+    """
+    args = exc.args
+    if (
+        len(args) == 1
+        and type(args[0]) is str
+        and type(exc).__str__ is BaseException.__str__
+    ):
+        return args[0]
+    return str(exc)
+
+
 async def exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """
     Global exception handler that converts exceptions to appropriate HTTP responses.
     """
     request_id = getattr(request.state, "request_id", "unknown")
-
-    # Handle custom MoneySplit exceptions
-    if isinstance(exc, ValidationError):
-        logger.warning(
-            f"Validation error: {str(exc)}",
-            extra={"request_id": request_id},
-        )
-        return JSONResponse(
-            status_code=400,
-            content={
-                "error": "Validation Error",
-                "message": str(exc),
-                "request_id": request_id,
-            },
-        )
-
-    elif isinstance(exc, NotFoundError):
-        logger.warning(
-            f"Resource not found: {str(exc)}",
-            extra={"request_id": request_id},
-        )
-        return JSONResponse(
-            status_code=404,
-            content={
-                "error": "Not Found",
-                "message": str(exc),
-                "request_id": request_id,
-            },
-        )
-
-    elif isinstance(exc, DatabaseError):
-        logger.error(
-            f"Database error: {str(exc)}",
-            extra={"request_id": request_id},
-            exc_info=True,
-        )
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": "Database Error",
-                "message": "An error occurred while accessing the database",
-                "request_id": request_id,
-            },
-        )
-
-    elif isinstance(exc, TaxCalculationError):
-        logger.error(
-            f"Tax calculation error: {str(exc)}",
-            extra={"request_id": request_id},
-            exc_info=True,
-        )
-        return JSONResponse(
-            status_code=400,
-            content={
-                "error": "Tax Calculation Error",
-                "message": str(exc),
-                "request_id": request_id,
-            },
-        )
-
-    elif isinstance(exc, MoneySplitException):
-        logger.error(
-            f"Application error: {str(exc)}",
-            extra={"request_id": request_id},
-            exc_info=True,
-        )
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": "Application Error",
-                "message": str(exc),
-                "request_id": request_id,
-            },
-        )
-
-    # Handle generic exceptions
-    else:
-        logger.critical(
-            f"Unhandled exception: {str(exc)}",
-            extra={"request_id": request_id},
-            exc_info=True,
-        )
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": "Internal Server Error",
-                "message": "An unexpected error occurred",
-                "request_id": request_id,
-            },
-        )
+    response = _error_response_for(exc)
+    message = _exception_message(exc)
+
+    # Warnings are expected client errors; anything more severe gets a traceback
+    logger.log(
+        response.log_level,
+        f"{response.log_prefix}: {message}",
+        extra={"request_id": request_id},
+        exc_info=response.log_level >= logging.ERROR,
+    )
+    if response.client_message is not None:
+        message = response.client_message
+    return JSONResponse(
+        status_code=response.status_code,
+        content={
+            "error": response.error,
+            "message": message,
+            "request_id": request_id,
+        },
+    )
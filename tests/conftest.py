@@ -1,4 +1,10 @@
-"""Pytest configuration and fixtures."""
+"""
+Pytest configuration and fixtures.
+
+Fixtures that only one test module needs live in that module. Module-scoped
+fixtures there that return computed results hand the same object to every
+test that uses them, so tests must treat those results as read-only.
+"""
 
 import pytest
 import os
@@ -8,16 +14,25 @@ import sqlite3
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-# Use same database as production for school project
-# os.environ['TESTING'] = '1'
-# os.environ['TEST_DB'] = 'test_example.db'
-
-
 @pytest.fixture(scope="session", autouse=True)
 def test_database():
-    """Use production database for school project."""
-    # No test database setup - using production database
-    yield "example.db"
+    """Give each xdist worker its own initialised and seeded database."""
+    from DB import setup
+
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    db_name = f"test_{worker}.db"
+    if os.path.exists(db_name):
+        os.remove(db_name)
+
+    os.environ["TESTING"] = "1"
+    os.environ["TEST_DB"] = db_name
+    setup.init_db()
+    setup.seed_default_brackets()
+
+    yield db_name
+
+    if os.path.exists(db_name):
+        os.remove(db_name)
 
 
 @pytest.fixture
@@ -184,6 +184,20 @@ class TestForecastingEndpoints:
 class TestVisualizationEndpoints:
     """Test visualization endpoints."""
 
+    @pytest.fixture(autouse=True, scope="class")
+    def seeded_project(self):
+        """Create a project so the charts do not depend on other classes running first."""
+        payload = {
+            "num_people": 1,
+            "revenue": 8000,
+            "costs": [800],
+            "country": "US",
+            "tax_type": "Individual",
+            "people": [{"name": "Chart Test User", "work_share": 1.0}],
+        }
+        response = client.post("/api/projects", json=payload)
+        assert response.status_code == 201
+
     def test_revenue_summary_visualization(self):
         """Test revenue summary visualization."""
         response = client.get("/api/visualizations/revenue-summary")
@@ -635,6 +635,13 @@ class TestDBSetupFunctions:
         for bracket in brackets:
             assert "income_limit" in bracket or len(bracket) >= 2
 
+    def test_require_tax_brackets(self):
+        """Test require_tax_brackets returns the brackets or raises when there are none."""
+        assert setup.require_tax_brackets("US", "Individual") == setup.get_tax_brackets("US", "Individual")
+
+        with pytest.raises(ValueError, match="No tax brackets found for Atlantis Individual"):
+            setup.require_tax_brackets("Atlantis", "Individual")
+
     def test_add_tax_bracket(self):
         """Test add_tax_bracket function."""
         bracket_id = setup.add_tax_bracket(
@@ -141,11 +141,13 @@ class TestPeopleOperations:
 
     def test_fetch_records_by_person_name(self):
         """Test fetching records by person name."""
-        people = setup.fetch_people_by_record(setup.fetch_last_records(n=1)[0][0])
-        if people:
-            name = people[0][1]  # Name is typically second field
-            results = setup.fetch_records_by_person(name)
-            assert isinstance(results, list)
+        records = setup.fetch_last_records(n=1)
+        if records:
+            people = setup.fetch_people_by_record(records[0][0])
+            if people:
+                name = people[0][1]  # Name is typically second field
+                results = setup.fetch_records_by_person(name)
+                assert isinstance(results, list)
 
     def test_fetch_records_by_invalid_person(self):
         """Test fetching records for non-existent person."""
@@ -264,13 +266,12 @@ class TestDatabaseQueries:
 class TestTaxBracketRetrieval:
     """Test tax bracket retrieval accuracy."""
 
-    def test_all_countries_have_brackets(self):
+    @pytest.mark.parametrize("country", ["US", "Spain"])
+    @pytest.mark.parametrize("tax_type", ["Individual", "Business"])
+    def test_all_countries_have_brackets(self, country, tax_type):
         """Test that all expected countries have tax brackets."""
-        countries = ["US", "Spain"]
-        for country in countries:
-            for tax_type in ["Individual", "Business"]:
-                brackets = setup.get_tax_brackets(country, tax_type)
-                assert len(brackets) > 0, f"No brackets for {country} {tax_type}"
+        brackets = setup.get_tax_brackets(country, tax_type)
+        assert len(brackets) > 0, f"No brackets for {country} {tax_type}"
 
     def test_bracket_limits_ascending(self):
         """Test that bracket limits are in ascending order."""
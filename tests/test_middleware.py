@@ -3,6 +3,7 @@ Comprehensive tests for API middleware.
 
 Tests logging middleware, exception handling, and request tracking.
 """
+import logging
 import pytest
 from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
@@ -14,13 +15,14 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from api.middleware import logging_middleware, exception_handler
+from api.middleware import logging_middleware, exception_handler, _exception_message
 from exceptions import (
     MoneySplitException,
     ValidationError,
     DatabaseError,
     TaxCalculationError,
     NotFoundError,
+    ForecastingError,
 )
 
 
@@ -473,3 +475,144 @@ class TestExceptionHandlerErrorFormats:
 
         assert data["error"] == "Database Error"
         assert "database" in data["message"].lower()
+
+
+class TestExceptionHandlerResolution:
+    """Test exceptions are matched to responses through their class hierarchy."""
+
+    @pytest.mark.asyncio
+    async def test_validation_error_subclass_uses_parent_response(self):
+        """Test a ValidationError subclass gets the 400 Validation Error response."""
+        import json
+
+        class EmailValidationError(ValidationError):
+            pass
+
+        request = MagicMock(spec=Request)
+        request.state = MagicMock()
+        request.state.request_id = "test-sub"
+
+        result = await exception_handler(request, EmailValidationError("Bad email"))
+
+        data = json.loads(result.body.decode())
+        assert result.status_code == 400
+        assert data["error"] == "Validation Error"
+        assert data["message"] == "Bad email"
+
+    @pytest.mark.asyncio
+    async def test_database_error_subclass_keeps_generic_message(self):
+        """Test a DatabaseError subclass gets the 500 response and hides its message."""
+        import json
+
+        class LockedDatabaseError(DatabaseError):
+            pass
+
+        request = MagicMock(spec=Request)
+        request.state = MagicMock()
+        request.state.request_id = "test-sub-db"
+
+        result = await exception_handler(request, LockedDatabaseError("database is locked"))
+
+        data = json.loads(result.body.decode())
+        assert result.status_code == 500
+        assert data["error"] == "Database Error"
+        assert data["message"] == "An error occurred while accessing the database"
+
+    @pytest.mark.asyncio
+    async def test_unmapped_moneysplit_exception_uses_application_error(self):
+        """Test an application exception without its own entry falls back to MoneySplitException."""
+        import json
+
+        request = MagicMock(spec=Request)
+        request.state = MagicMock()
+        request.state.request_id = "test-forecast"
+
+        result = await exception_handler(request, ForecastingError("Not enough data"))
+
+        data = json.loads(result.body.decode())
+        assert result.status_code == 500
+        assert data["error"] == "Application Error"
+        assert data["message"] == "Not enough data"
+
+    @pytest.mark.asyncio
+    async def test_unmapped_exception_falls_through_to_500(self):
+        """Test an exception outside the mapping gets the generic 500 response."""
+        import json
+
+        request = MagicMock(spec=Request)
+        request.state = MagicMock()
+        request.state.request_id = "test-runtime"
+
+        result = await exception_handler(request, RuntimeError("internal detail"))
+
+        data = json.loads(result.body.decode())
+        assert result.status_code == 500
+        assert data["error"] == "Internal Server Error"
+        assert data["message"] == "An unexpected error occurred"
+
+
+class TestExceptionHandlerLogging:
+    """Test each exception family is logged at its level, with a traceback only for errors."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "exc, level, prefix",
+        [
+            (ValidationError("Invalid input"), logging.WARNING, "Validation error"),
+            (NotFoundError("Project not found"), logging.WARNING, "Resource not found"),
+            (DatabaseError("Connection failed"), logging.ERROR, "Database error"),
+            (TaxCalculationError("Invalid tax bracket"), logging.ERROR, "Tax calculation error"),
+            (MoneySplitException("Generic error"), logging.ERROR, "Application error"),
+            (ForecastingError("Not enough data"), logging.ERROR, "Application error"),
+            (RuntimeError("internal detail"), logging.CRITICAL, "Unhandled exception"),
+        ],
+        ids=["validation", "not_found", "database", "tax_calculation", "application", "subclass", "unhandled"],
+    )
+    async def test_exception_logged_at_family_level(self, caplog, exc, level, prefix):
+        """Test the log record's level and message, and that only ERROR and above carry exc_info."""
+        request = MagicMock(spec=Request)
+        request.state = MagicMock()
+        request.state.request_id = "test-log"
+
+        caplog.set_level(logging.DEBUG, logger="api.middleware")
+        # FastAPI calls handlers while the exception is being handled
+        try:
+            raise exc
+        except Exception as raised:
+            await exception_handler(request, raised)
+
+        [record] = [r for r in caplog.records if r.name == "api.middleware"]
+        assert record.levelno == level
+        assert record.getMessage() == f"{prefix}: {exc.args[0]}"
+        assert record.request_id == "test-log"
+        if level >= logging.ERROR:
+            assert record.exc_info[1] is exc
+        else:
+            assert not record.exc_info
+
+
+class TestExceptionMessage:
+    """Test the message extracted from exceptions for logs and responses."""
+
+    def test_single_string_arg_is_returned(self):
+        """Test the common single-message case returns the message itself."""
+        assert _exception_message(ValidationError("Invalid input")) == "Invalid input"
+
+    def test_overridden_str_is_used(self):
+        """Test classes that override __str__ keep their own formatting (KeyError quotes its key)."""
+        exc = KeyError("x")
+        assert _exception_message(exc) == str(exc) == "'x'"
+
+    def test_multiple_args_match_str(self):
+        """Test exceptions with several args are formatted like str()."""
+        exc = ValueError("bad value", 42)
+        assert _exception_message(exc) == str(exc) == "('bad value', 42)"
+
+    def test_non_string_arg_matches_str(self):
+        """Test a single non-string arg is converted like str()."""
+        exc = ValueError(42)
+        assert _exception_message(exc) == "42"
+
+    def test_no_args_matches_str(self):
+        """Test an exception without args gives an empty message."""
+        assert _exception_message(RuntimeError()) == ""